@@ -15,34 +15,109 @@ import numpy
 import h5py
 from torchswe.utils.config import get_config
 
+try:
+    import numba
+except ImportError:  # fall back to the pure NumPy implementations
+    numba = None
+
+
+def _signatures(nargs):
+    """Single- and double-precision signatures of a ufunc taking `nargs` arguments."""
+    return [f"{t}({', '.join([t]*nargs)})" for t in ("float32", "float64")]
+
+
+if numba is not None:
+    # pylint: disable=invalid-name, too-many-arguments
+
+    @numba.njit(cache=True)
+    def _topo_point(x, y, h0, L, a):
+        """Topography elevation at a single point."""
+        xr = x - L / 2.
+        yr = y - L / 2.
+        return - h0 * (1. - (xr * xr + yr * yr) / (a * a))
+
+    @numba.njit(cache=True)
+    def _depth_point(x, y, h0, L, a, C1, C2):
+        """Exact (non-negative) depth at a single point."""
+        xr = x - L / 2.
+        yr = y - L / 2.
+        h = h0 * (C1 - 1. - ((xr * xr + yr * yr) / (a * a)) * (C2 - 1.))
+        return max(h - _topo_point(x, y, h0, L, a), 0.)
+
+    @numba.vectorize(_signatures(5), nopython=True, target="parallel", cache=True)
+    def _topo_kernel(x, y, h0, L, a):
+        """Ufunc of the topography elevation."""
+        return _topo_point(x, y, h0, L, a)
+
+    @numba.vectorize(_signatures(7), nopython=True, target="parallel", cache=True)
+    def _w_kernel(x, y, h0, L, a, C1, C2):
+        """Ufunc of the exact w."""
+        return _depth_point(x, y, h0, L, a, C1, C2) + _topo_point(x, y, h0, L, a)
+
+    @numba.vectorize(_signatures(8), nopython=True, target="parallel", cache=True)
+    def _hu_kernel(x, y, h0, L, a, C1, C2, coeff):
+        """Ufunc of the exact hu."""
+        return _depth_point(x, y, h0, L, a, C1, C2) * coeff * (x - L / 2.)
+
+    @numba.vectorize(_signatures(8), nopython=True, target="parallel", cache=True)
+    def _hv_kernel(x, y, h0, L, a, C1, C2, coeff):
+        """Ufunc of the exact hv."""
+        return _depth_point(x, y, h0, L, a, C1, C2) * coeff * (y - L / 2.)
+
 
 def get_topo(x, y, h0=0.1, L=4., a=1.):
-    """Topography."""
+    """Topography.
+
+    `x` and `y` only have to be broadcastable to each other, e.g., `x[None, :]` and `y[:, None]`.
+    """
     # pylint: disable=invalid-name
 
-    r = numpy.sqrt((x-L/2.)**2+(y-L/2.)**2)
-    return - h0 * (1. - (r / a)**2)
+    if numba is not None:
+        return _topo_kernel(x, y, h0, L, a)
+
+    xr = x - L / 2.
+    yr = y - L / 2.
+    return - h0 * (1. - (xr * xr + yr * yr) / (a * a))
 
 
 def exact_soln(x, y, t, g=9.81, h0=0.1, L=4., a=1., r0=0.8):
-    """Exact solution."""
+    """Exact solution.
+
+    `x` and `y` only have to be broadcastable to each other, e.g., `x[None, :]` and `y[:, None]`.
+    """
     # pylint: disable=invalid-name, too-many-arguments
 
     omega = numpy.sqrt(8.*h0*g) / a
     A = (a**2 - r0**2) / (a**2 + r0**2)
-    z = get_topo(x, y, h0, L, a)
 
     C0 = 1. - A * numpy.cos(omega*t)
     C1 = numpy.sqrt((1.-A*A)) / C0
     C2 = (1. - A * A) / (C0**2)
 
-    h = h0 * (C1 - 1. - ((numpy.sqrt((x-L/2.)**2+(y-L/2.)**2) / a)**2) * (C2 - 1.)) - z
+    coeff = 0.5 * omega * A * numpy.sin(omega*t) / C0
+
+    # each ufunc evaluates the whole expression per point; no intermediate arrays
+    if numba is not None:
+        return numpy.stack((
+            _w_kernel(x, y, h0, L, a, C1, C2),
+            _hu_kernel(x, y, h0, L, a, C1, C2, coeff),
+            _hv_kernel(x, y, h0, L, a, C1, C2, coeff),
+        ), 0)
+
+    z = get_topo(x, y, h0, L, a)
+
+    # only the 2D arrays below are full-size; xr and yr keep the shapes of x and y
+    xr = x - L / 2.
+    yr = y - L / 2.
+    r2 = xr * xr + yr * yr
+
+    h = h0 * (C1 - 1. - (r2 / (a * a)) * (C2 - 1.)) - z
     h[h < 0.] = 0.
 
     return numpy.concatenate((
         (h + z)[None, ...],
-        (h * 0.5 * omega * A * (x - L/2.) * numpy.sin(omega*t) / C0)[None, ...],
-        (h * 0.5 * omega * A * (y - L/2.) * numpy.sin(omega*t) / C0)[None, ...]
+        (h * coeff * xr)[None, ...],
+        (h * coeff * yr)[None, ...]
     ), 0)
 
 
@@ -57,32 +132,39 @@ def main():
     nx, ny = config.spatial.discretization
     dtype = config.params.dtype
 
+    # chunk (y, x) arrays by whole rows and compress them lightly
+    h5opts = {"compression": "gzip", "compression_opts": 1, "shuffle": True}
+
     # gridlines at vertices
     x = numpy.linspace(*config.spatial.domain[:2], nx+1, dtype=dtype)
     y = numpy.linspace(*config.spatial.domain[2:], ny+1, dtype=dtype)
 
     # topography
-    topo = get_topo(*numpy.meshgrid(x, y))
+    topo = get_topo(x[None, :], y[:, None])
 
     # write topography file
     with h5py.File(case.joinpath(config.topo.file), "w") as root:
         root.create_dataset(config.topo.xykeys[0], x.shape, x.dtype, x)
         root.create_dataset(config.topo.xykeys[1], y.shape, y.dtype, y)
-        root.create_dataset(config.topo.key, topo.shape, topo.dtype, topo)
+        root.create_dataset(
+            config.topo.key, topo.shape, topo.dtype, topo,
+            chunks=(min(topo.shape[0], 64), topo.shape[1]), **h5opts)
 
     # gridlines at cell centers
     x = (x[1:] + x[:-1]) / 2.
     y = (y[1:] + y[:-1]) / 2.
 
     # write initial conditions, defined on cell centers
-    ic = exact_soln(*numpy.meshgrid(x, y), 0.)
+    ic = exact_soln(x[None, :], y[:, None], 0.)
 
     # write topography file
     with h5py.File(case.joinpath(config.ic.file), "w") as root:
         root.create_dataset(config.ic.xykeys[0], x.shape, x.dtype, x)
         root.create_dataset(config.ic.xykeys[1], y.shape, y.dtype, y)
         for i in range(3):
-            root.create_dataset(config.ic.keys[i], ic[i].shape, ic[i].dtype, ic[i])
+            root.create_dataset(
+                config.ic.keys[i], ic[i].shape, ic[i].dtype, ic[i],
+                chunks=(min(ic.shape[1], 64), ic.shape[2]), **h5opts)
 
     return 0
 
@@ -15,24 +15,85 @@ import numpy
 import h5py
 from torchswe.utils.config import get_config
 
+try:
+    import numba
+except ImportError:  # fall back to the pure NumPy implementations
+    numba = None
+
+
+def _signatures(nargs):
+    """Single- and double-precision signatures of a ufunc taking `nargs` arguments."""
+    return [f"{t}({', '.join([t]*nargs)})" for t in ("float32", "float64")]
+
+
+if numba is not None:
+    # pylint: disable=invalid-name, too-many-arguments
+
+    @numba.njit(cache=True)
+    def _topo_point(x, y, h0, L, a):
+        """Topography elevation at a single point."""
+        xr = x - L / 2.
+        yr = y - L / 2.
+        return - h0 * (1. - (xr * xr + yr * yr) / (a * a))
+
+    @numba.njit(cache=True)
+    def _depth_point(x, y, h0, L, a, eta, cot, sot):
+        """Exact (non-negative) depth at a single point."""
+        h = eta * h0 * (2 * (x - L / 2.) * cot + 2 * (y - L / 2.) * sot - eta) / (a * a)
+        return max(h - _topo_point(x, y, h0, L, a), 0.)
+
+    @numba.vectorize(_signatures(5), nopython=True, target="parallel", cache=True)
+    def _topo_kernel(x, y, h0, L, a):
+        """Ufunc of the topography elevation."""
+        return _topo_point(x, y, h0, L, a)
+
+    @numba.vectorize(_signatures(8), nopython=True, target="parallel", cache=True)
+    def _w_kernel(x, y, h0, L, a, eta, cot, sot):
+        """Ufunc of the exact w."""
+        return _depth_point(x, y, h0, L, a, eta, cot, sot) + _topo_point(x, y, h0, L, a)
+
+    @numba.vectorize(_signatures(9), nopython=True, target="parallel", cache=True)
+    def _momentum_kernel(x, y, h0, L, a, eta, cot, sot, coeff):
+        """Ufunc of the exact hu or hv, i.e., depth times a constant velocity `coeff`."""
+        return _depth_point(x, y, h0, L, a, eta, cot, sot) * coeff
+
 
 def get_topo(x, y, h0=0.1, L=4., a=1.):
-    """Topography."""
+    """Topography.
+
+    `x` and `y` only have to be broadcastable to each other, e.g., `x[None, :]` and `y[:, None]`.
+    """
     # pylint: disable=invalid-name
 
-    r = numpy.sqrt((x-L/2.)**2+(y-L/2.)**2)
-    return - h0 * (1. - (r / a)**2)
+    if numba is not None:
+        return _topo_kernel(x, y, h0, L, a)
+
+    xr = x - L / 2.
+    yr = y - L / 2.
+    return - h0 * (1. - (xr * xr + yr * yr) / (a * a))
 
 
 def exact_soln(x, y, t, g=9.81, h0=0.1, L=4., a=1., eta=0.5):
-    """Exact solution."""
+    """Exact solution.
+
+    `x` and `y` only have to be broadcastable to each other, e.g., `x[None, :]` and `y[:, None]`.
+    """
     # pylint: disable=invalid-name, too-many-arguments
 
     omega = numpy.sqrt(2.*h0*g) / a
-    z = get_topo(x, y, h0, L, a)
     cot = numpy.cos(omega*t)
     sot = numpy.sin(omega*t)
 
+    # each ufunc evaluates the whole expression per point; no intermediate arrays
+    if numba is not None:
+        return numpy.stack((
+            _w_kernel(x, y, h0, L, a, eta, cot, sot),
+            _momentum_kernel(x, y, h0, L, a, eta, cot, sot, - eta * omega * sot),
+            _momentum_kernel(x, y, h0, L, a, eta, cot, sot, eta * omega * cot),
+        ), 0)
+
+    z = get_topo(x, y, h0, L, a)
+
     h = eta * h0 * (2 * (x - L / 2) * cot + 2 * (y - L / 2.) * sot - eta) / (a * a) - z
     h[h < 0.] = 0.
 
@@ -54,32 +115,39 @@ def main():
     nx, ny = config.spatial.discretization
     dtype = config.params.dtype
 
+    # chunk (y, x) arrays by whole rows and compress them lightly
+    h5opts = {"compression": "gzip", "compression_opts": 1, "shuffle": True}
+
     # gridlines at vertices
     x = numpy.linspace(*config.spatial.domain[:2], nx+1, dtype=dtype)
     y = numpy.linspace(*config.spatial.domain[2:], ny+1, dtype=dtype)
 
     # topography
-    topo = get_topo(*numpy.meshgrid(x, y))
+    topo = get_topo(x[None, :], y[:, None])
 
     # write topography file
     with h5py.File(case.joinpath(config.topo.file), "w") as root:
         root.create_dataset(config.topo.xykeys[0], x.shape, x.dtype, x)
         root.create_dataset(config.topo.xykeys[1], y.shape, y.dtype, y)
-        root.create_dataset(config.topo.key, topo.shape, topo.dtype, topo)
+        root.create_dataset(
+            config.topo.key, topo.shape, topo.dtype, topo,
+            chunks=(min(topo.shape[0], 64), topo.shape[1]), **h5opts)
 
     # gridlines at cell centers
     x = (x[1:] + x[:-1]) / 2.
     y = (y[1:] + y[:-1]) / 2.
 
     # initial conditions, defined on cell centers
-    ic = exact_soln(*numpy.meshgrid(x, y), 0.)
+    ic = exact_soln(x[None, :], y[:, None], 0.)
 
     # write topography file
     with h5py.File(case.joinpath(config.ic.file), "w") as root:
         root.create_dataset(config.ic.xykeys[0], x.shape, x.dtype, x)
         root.create_dataset(config.ic.xykeys[1], y.shape, y.dtype, y)
         for i in range(3):
-            root.create_dataset(config.ic.keys[i], ic[i].shape, ic[i].dtype, ic[i])
+            root.create_dataset(
+                config.ic.keys[i], ic[i].shape, ic[i].dtype, ic[i],
+                chunks=(min(ic.shape[1], 64), ic.shape[2]), **h5opts)
 
     return 0
 
@@ -24,6 +24,9 @@ def main():
     # aliases
     nx, ny = config.spatial.discretization
 
+    # chunk (y, x) arrays by whole rows and compress them lightly
+    h5opts = {"compression": "gzip", "compression_opts": 1, "shuffle": True}
+
     # gridlines
     xi = numpy.linspace(1.2, 0.0, nx+1, dtype=config.params.dtype)  # coordinate along the plane
     x = 1. - xi * numpy.cos(numpy.pi*2.5/180.)  # coordinates in flow direction but horizontal
@@ -36,7 +39,9 @@ def main():
     with h5py.File(case.joinpath(config.topo.file), "w") as root:
         root.create_dataset(config.topo.xykeys[0], x.shape, x.dtype, x)
         root.create_dataset(config.topo.xykeys[1], y.shape, y.dtype, y)
-        root.create_dataset(config.topo.key, topo.shape, topo.dtype, topo)
+        root.create_dataset(
+            config.topo.key, topo.shape, topo.dtype, topo,
+            chunks=(min(topo.shape[0], 64), topo.shape[1]), **h5opts)
 
     return 0
 
@@ -27,6 +27,9 @@ def main():
     nx, ny = config.spatial.discretization
     dtype = config.params.dtype
 
+    # chunk (y, x) arrays by whole rows and compress them lightly
+    h5opts = {"compression": "gzip", "compression_opts": 1, "shuffle": True}
+
     # gridlines at vertices
     x = numpy.linspace(*config.spatial.domain[:2], nx+1, dtype=dtype)
     y = numpy.linspace(*config.spatial.domain[2:], ny+1, dtype=dtype)
@@ -38,7 +41,9 @@ def main():
     with h5py.File(case.joinpath(config.topo.file), "w") as root:
         root.create_dataset(config.topo.xykeys[0], x.shape, x.dtype, x)
         root.create_dataset(config.topo.xykeys[1], y.shape, y.dtype, y)
-        root.create_dataset(config.topo.key, topo.shape, topo.dtype, topo)
+        root.create_dataset(
+            config.topo.key, topo.shape, topo.dtype, topo,
+            chunks=(min(topo.shape[0], 64), topo.shape[1]), **h5opts)
 
     return 0
 
@@ -27,6 +27,9 @@ def main():
     nx, ny = config.spatial.discretization
     dtype = config.params.dtype
 
+    # chunk (y, x) arrays by whole rows and compress them lightly
+    h5opts = {"compression": "gzip", "compression_opts": 1, "shuffle": True}
+
     # gridlines at vertices
     x = numpy.linspace(*config.spatial.domain[:2], nx+1, dtype=dtype)
     y = numpy.linspace(*config.spatial.domain[2:], ny+1, dtype=dtype)
@@ -40,7 +43,9 @@ def main():
     with h5py.File(case.joinpath(config.topo.file), "w") as root:
         root.create_dataset(config.topo.xykeys[0], x.shape, x.dtype, x)
         root.create_dataset(config.topo.xykeys[1], y.shape, y.dtype, y)
-        root.create_dataset(config.topo.key, topo.shape, topo.dtype, topo)
+        root.create_dataset(
+            config.topo.key, topo.shape, topo.dtype, topo,
+            chunks=(min(topo.shape[0], 64), topo.shape[1]), **h5opts)
 
     # gridlines at cell centers
     x = (x[1:] + x[:-1]) / 2.
@@ -50,15 +55,16 @@ def main():
     ic = numpy.zeros((3, ny, nx), dtype=dtype)
 
     # i.c.: w
-    x2d, _ = numpy.meshgrid(x, y)
-    ic[0] = numpy.where(x2d <= 750., 20., 15.)
+    ic[0] = numpy.where(x <= 750., 20., 15.)  # broadcasted to all rows
 
     # write initial condition file
     with h5py.File(case.joinpath(config.ic.file), "w") as root:
         root.create_dataset(config.ic.xykeys[0], x.shape, x.dtype, x)
         root.create_dataset(config.ic.xykeys[1], y.shape, y.dtype, y)
         for i in range(3):
-            root.create_dataset(config.ic.keys[i], ic[i].shape, ic[i].dtype, ic[i])
+            root.create_dataset(
+                config.ic.keys[i], ic[i].shape, ic[i].dtype, ic[i],
+                chunks=(min(ic.shape[1], 64), ic.shape[2]), **h5opts)
 
     return 0
 
@@ -27,19 +27,23 @@ def main():
     nx, ny = config.spatial.discretization
     dtype = config.params.dtype
 
+    # chunk (y, x) arrays by whole rows and compress them lightly
+    h5opts = {"compression": "gzip", "compression_opts": 1, "shuffle": True}
+
     # gridlines at vertices
     x = numpy.linspace(*config.spatial.domain[:2], nx+1, dtype=dtype)
     y = numpy.linspace(*config.spatial.domain[2:], ny+1, dtype=dtype)
 
     # topogeaphy elevation
-    x2d, y2d = numpy.meshgrid(x, y)
-    topo = 0.8 * numpy.exp(-5.*numpy.power(x2d-0.9, 2)-50.*numpy.power(y2d-0.5, 2))
+    topo = 0.8 * numpy.exp(-5.*numpy.power(x[None, :]-0.9, 2)-50.*numpy.power(y[:, None]-0.5, 2))
 
     # write topography file
     with h5py.File(case.joinpath(config.topo.file), "w") as root:
         root.create_dataset(config.topo.xykeys[0], x.shape, x.dtype, x)
         root.create_dataset(config.topo.xykeys[1], y.shape, y.dtype, y)
-        root.create_dataset(config.topo.key, topo.shape, topo.dtype, topo)
+        root.create_dataset(
+            config.topo.key, topo.shape, topo.dtype, topo,
+            chunks=(min(topo.shape[0], 64), topo.shape[1]), **h5opts)
 
     # gridlines at cell centers
     x = (x[1:] + x[:-1]) / 2.
@@ -49,16 +53,18 @@ def main():
     ic = numpy.zeros((3, ny, nx), dtype=dtype)
 
     # i.c.: w
-    x2d, _ = numpy.meshgrid(x, y)
     ic[0] = 1.0
-    ic[0][(x2d >= 0.05)*(x2d <= 0.15)] += 0.01
+    # x is sorted, so the region 0.05 <= x <= 0.15 is a contiguous slice; no masks needed
+    ic[0][:, numpy.searchsorted(x, 0.05):numpy.searchsorted(x, 0.15, "right")] += 0.01
 
     # write initial condition file
     with h5py.File(case.joinpath(config.ic.file), "w") as root:
         root.create_dataset(config.ic.xykeys[0], x.shape, x.dtype, x)
         root.create_dataset(config.ic.xykeys[1], y.shape, y.dtype, y)
         for i in range(3):
-            root.create_dataset(config.ic.keys[i], ic[i].shape, ic[i].dtype, ic[i])
+            root.create_dataset(
+                config.ic.keys[i], ic[i].shape, ic[i].dtype, ic[i],
+                chunks=(min(ic.shape[1], 64), ic.shape[2]), **h5opts)
 
     return 0
 
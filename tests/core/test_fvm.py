@@ -0,0 +1,158 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+# vim:fenc=utf-8
+#
+# Copyright © 2021 Pi-Yueh Chuang <pychuang@gwu.edu>
+#
+# Distributed under terms of the BSD 3-Clause license.
+
+"""Tests for torchswe.fvm.
+"""
+import pytest
+from mpi4py import MPI
+from torchswe import nplike
+from torchswe.__main__ import is_invariant_in_y
+from torchswe.fvm import prepare_rhs
+from torchswe.fvm import get_rhs_preparer
+from torchswe.bcs import get_ghost_cell_updaters
+from torchswe.kernels import reconstruct_cell_centers
+from torchswe.sources import topography_gradient
+from torchswe.utils.config import Config
+from torchswe.utils.data import get_domain
+from torchswe.utils.data import get_initial_states
+from torchswe.utils.data.topography import _setup_topography
+from torchswe.utils.misc import DummyDict
+from torchswe.utils.misc import exchange_states
+
+
+def _get_config(one_d=False, **kwargs):
+    """Get a Config of a small case; `kwargs` replace the top-level blocks."""
+
+    data = {
+        "spatial": {"domain": [0., 1., 0., 1.], "discretization": [16, 12], "one_d": one_d},
+        "temporal": {"output": ["t_start t_end no save", 0., 1.]},
+        "boundary": {
+            ornt: {"types": ["extrap", "extrap", "extrap"]}
+            for ornt in ("west", "east", "south", "north")
+        },
+        "initial": {"values": [1., 0., 0.]},
+        "topography": {"file": "topo.nc", "key": "elevation", "xykeys": ["x", "y"]},
+    }
+    data.update(kwargs)
+    return Config(**data)
+
+
+def _get_states(config, wy=0., by=0., hv=0.):
+    """Get non-trivial states and topography; `wy`, `by`, and `hv` control variations in y."""
+
+    domain = get_domain(MPI.COMM_WORLD, config)
+
+    # topography elevation at vertices
+    x, y = nplike.meshgrid(domain.x.v, domain.y.v)
+    elev = 0.1 * nplike.sin(6. * x) + by * 0.05 * nplike.cos(4. * y) * (x + 1.)
+    topo = _setup_topography(domain, elev, domain.x.v, domain.y.v)
+
+    # initial conditions at cell centers
+    x, y = nplike.meshgrid(domain.x.c, domain.y.c)
+    states = get_initial_states(config, domain)
+    states.q[(0,)+domain.nonhalo_c] = topo.c[domain.nonhalo_c] + 1. + 0.1 * nplike.cos(5. * x) * (
+        1. + wy * nplike.sin(3. * y))
+    states.q[(1,)+domain.nonhalo_c] = 0.2 * nplike.sin(2. * x)
+    states.q[(2,)+domain.nonhalo_c] = hv * nplike.cos(2. * y)
+
+    return states, topo
+
+
+def _get_case(config, **kwargs):
+    """Get states, runtime, and config ready for calculating the right-hand-side."""
+
+    states, topo = _get_states(config, **kwargs)
+
+    runtime = DummyDict(topo=topo, tol=1e-12, sources=[topography_gradient], stiff_sources=[])
+    states = exchange_states(states)
+    states = get_ghost_cell_updaters(states, topo, config.bc)(states)
+    states = reconstruct_cell_centers(states, runtime, config)
+
+    return states, runtime, config
+
+
+@pytest.mark.parametrize("one_d", [False, True])
+def test_rhs_preparer_matches_prepare_rhs(one_d):
+    """The generated `rhs_preparer` must give the same results as the generic `prepare_rhs`."""
+
+    kwargs = {} if one_d else {"wy": 1., "by": 1., "hv": 0.1}
+
+    states, runtime, config = _get_case(_get_config(one_d), **kwargs)
+    states, ans_dt = prepare_rhs(states, runtime, config)
+    ans_s = states.s.copy()
+
+    states, runtime, config = _get_case(_get_config(one_d), **kwargs)
+    states, result_dt = get_rhs_preparer(states, runtime, config)(states, runtime, config)
+
+    assert nplike.any(ans_s != 0.)
+    assert nplike.array_equal(states.s, ans_s)
+    assert result_dt == ans_dt
+
+
+def test_one_d_matches_two_d():
+    """Skipping y-direction terms must not change the results of a y-invariant problem."""
+
+    # dy > dx and v = 0, so the CFL constraint in y is never the binding one
+    states, runtime, config = _get_case(_get_config(False))
+    states, ans_dt = prepare_rhs(states, runtime, config)
+    ans_s = states.s.copy()
+
+    states, runtime, config = _get_case(_get_config(True))
+    states, result_dt = prepare_rhs(states, runtime, config)
+
+    assert nplike.any(ans_s != 0.)
+    assert nplike.allclose(states.s, ans_s, rtol=1e-12, atol=1e-12)
+    assert result_dt == pytest.approx(ans_dt, rel=1e-12)
+
+
+def test_is_invariant_in_y():
+    """`is_invariant_in_y` must reject anything that makes solutions vary in y."""
+
+    props = {
+        "density": 1000., "reference mu": 1., "reference temperature": 20.,
+        "ambient temperature": 20.
+    }
+
+    def _bcs(**kwargs):
+        bcs = {ornt: {"types": ["extrap", "extrap", "extrap"]} for ornt in ("west", "east")}
+        bcs.update({
+            ornt: {"types": ["outflow", "outflow", "outflow"]} for ornt in ("south", "north")
+        })
+        bcs.update(kwargs)
+        return bcs
+
+    def _check(config, **kwargs):
+        states, topo = _get_states(config, **kwargs)
+        return is_invariant_in_y(states, topo, config)
+
+    # a valid 1D problem
+    assert _check(_get_config(True))
+    assert _check(_get_config(True, boundary=_bcs()))
+    assert _check(_get_config(True, friction={"roughness": 0.1}, **{"fluid properties": props}))
+
+    # y-varying topography, y-varying w, and nonzero hv
+    assert not _check(_get_config(True), by=1.)
+    assert not _check(_get_config(True), wy=1.)
+    assert not _check(_get_config(True), hv=0.1)
+
+    # BCs that can introduce y-variation
+    south = {"types": ["const", "const", "const"], "values": [1., 0., 0.]}
+    assert not _check(_get_config(True, boundary=_bcs(south=south)))
+    north = {"types": ["extrap", "inflow", "inflow"], "values": [None, 0., 0.1]}
+    assert not _check(_get_config(True, boundary=_bcs(north=north)))
+
+    # point source
+    ptsource = {"location": [0.5, 0.5], "times": [1.], "rates": [1., 0.]}
+    assert not _check(_get_config(
+        True, **{"point source": ptsource, "fluid properties": props}))
+
+    # roughness from a file
+    friction = {
+        "roughness file": "roughness.nc", "roughness key": "r", "roughness xykeys": ["x", "y"]
+    }
+    assert not _check(_get_config(True, friction=friction, **{"fluid properties": props}))
@@ -0,0 +1,133 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+# vim:fenc=utf-8
+#
+# Copyright © 2021 Pi-Yueh Chuang <pychuang@gwu.edu>
+#
+# Distributed under terms of the BSD 3-Clause license.
+
+"""Tests for kernels in torchswe.kernels against plain array expressions.
+"""
+import os
+import numpy
+import pytest
+from mpi4py import MPI
+from torchswe import nplike
+from torchswe.kernels import central_scheme
+from torchswe.kernels import get_discontinuous_flux
+from torchswe.kernels import get_flux_divergence
+from torchswe.kernels import get_local_speed
+from torchswe.kernels import get_numerical_flux
+from torchswe.kernels import get_max_local_speed
+from torchswe.utils.config import Config
+from torchswe.utils.data import get_empty_states
+
+
+def _get_states(dtype, seed=0):
+    """Get empty States of a small case and a random number generator."""
+
+    config = Config(**{
+        "spatial": {"domain": [0., 1.6, 0., 1.1], "discretization": [16, 11]},
+        "temporal": {"output": ["t_start t_end no save", 0., 1.]},
+        "boundary": {
+            ornt: {"types": ["extrap", "extrap", "extrap"]}
+            for ornt in ("west", "east", "south", "north")
+        },
+        "initial": {"values": [1., 0., 0.]},
+        "topography": {"file": "topo.nc", "key": "elevation", "xykeys": ["x", "y"]},
+        "parameters": {"dtype": dtype},
+    })
+
+    return get_empty_states(config, comm=MPI.COMM_WORLD), numpy.random.default_rng(seed)
+
+
+def _fill(array, rng, low=-1., high=1.):
+    """Fill an array in-place with random values (works for both NumPy and CuPy arrays)."""
+    array[...] = nplike.asarray(rng.uniform(low, high, array.shape).astype(array.dtype))
+
+
+def _fill_face_states(states, rng):
+    """Fill both sides of all faces with random but consistent (i.e., w = h + b) states."""
+
+    for face in (states.face.x, states.face.y):
+        for side in (face.plus, face.minus):
+            U, Q = side.p, side.q  # pylint: disable=invalid-name
+            _fill(U[0], rng, 0.1, 1.)  # h > 0
+            _fill(U[1:], rng)  # u, v
+            _fill(Q[0], rng)  # b for now
+            Q[0] += U[0]
+            Q[1] = U[0] * U[1]
+            Q[2] = U[0] * U[2]
+
+
+@pytest.mark.parametrize("dtype", ["float32", "float64"])
+@pytest.mark.parametrize("one_d", [False, True])
+def test_get_flux_divergence(dtype, one_d):
+    """Compare get_flux_divergence against the differences of face fluxes."""
+
+    states, rng = _get_states(dtype)
+    xH, yH = states.face.x.cf, states.face.y.cf
+    _fill(xH, rng)
+    _fill(yH, rng)
+
+    dy, dx = states.domain.delta
+    ans = (xH[:, :, :-1] - xH[:, :, 1:]) / dx
+    if not one_d:
+        ans += (yH[:, :-1, :] - yH[:, 1:, :]) / dy
+
+    states = get_flux_divergence(states, one_d)
+
+    rtol = 1e-5 if dtype == "float32" else 1e-12
+    assert states.s.dtype == numpy.dtype(dtype)
+    assert nplike.allclose(states.s, ans, rtol=rtol, atol=rtol)
+
+
+@pytest.mark.parametrize("dtype", ["float32", "float64"])
+@pytest.mark.parametrize("axis", ["x", "y"])
+def test_get_max_local_speed(dtype, axis):
+    """Compare get_max_local_speed against max(maximum(plus.a, -minus.a))."""
+
+    states, rng = _get_states(dtype)
+    face = getattr(states.face, axis)
+
+    # local speeds are clipped at zero by construction: plus.a >= 0 and minus.a <= 0
+    _fill(face.plus.a, rng, 0., 1.)
+    _fill(face.minus.a, rng, -1., 0.)
+
+    ans = nplike.max(nplike.maximum(face.plus.a, -face.minus.a))
+    result = get_max_local_speed(face)
+    assert result.dtype == numpy.dtype(dtype)
+    assert float(result) == float(ans)
+
+    # the maximum held by minus.a and then by plus.a
+    face.minus.a[-1, -1] = -2.
+    assert float(get_max_local_speed(face)) == 2.
+
+    face.plus.a[0, 0] = 3.
+    assert float(get_max_local_speed(face)) == 3.
+
+
+@pytest.mark.skipif(os.environ.get("USE_CUPY") != "1", reason="The fused kernels are CuPy-only.")
+@pytest.mark.parametrize("dtype", ["float32", "float64"])
+def test_get_numerical_flux(dtype):
+    """The fused get_numerical_flux must match the three-step path it replaces."""
+
+    pytest.importorskip("cupy")
+
+    states, rng = _get_states(dtype, seed=1)
+    _fill_face_states(states, rng)
+    states = get_numerical_flux(states, 9.81)
+
+    ans, rng = _get_states(dtype, seed=1)
+    _fill_face_states(ans, rng)
+    ans = get_local_speed(ans, 9.81)
+    ans = get_discontinuous_flux(ans, 9.81)
+    ans = central_scheme(ans)
+
+    rtol = 1e-5 if dtype == "float32" else 1e-12
+    for axis in ("x", "y"):
+        face, ref = getattr(states.face, axis), getattr(ans.face, axis)
+        assert nplike.any(ref.cf != 0.)
+        assert nplike.allclose(face.plus.a, ref.plus.a, rtol=rtol, atol=rtol)
+        assert nplike.allclose(face.minus.a, ref.minus.a, rtol=rtol, atol=rtol)
+        assert nplike.allclose(face.cf, ref.cf, rtol=rtol, atol=rtol)
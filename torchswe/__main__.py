@@ -34,6 +34,7 @@ from torchswe.utils.io import read_snapshot
 from torchswe.utils.config import get_config
 from torchswe.kernels import reconstruct_cell_centers
 from torchswe.bcs import get_ghost_cell_updaters
+from torchswe.fvm import get_rhs_preparer
 from torchswe.temporal import euler, ssprk2, ssprk3
 from torchswe.sources import topography_gradient, point_mass_source, friction, zero_stiff_terms
 
@@ -218,6 +219,51 @@ def get_logger(filename, level, mpi_size, mpi_rank):
     return logger
 
 
+def is_invariant_in_y(states, topo, config):
+    """Check whether a problem stays invariant in y, i.e., whether `spatial.one_d` is safe.
+
+    Arguments
+    ---------
+    states : torchswe.utils.data.States
+        The initial solution.
+    topo : torchswe.utils.data.Topography
+    config : torchswe.utils.config.Config
+
+    Returns
+    -------
+    A bool. This is a collective call, and all ranks get the same result.
+
+    Notes
+    -----
+    The rows of w, hu, and topography vertices in each rank are compared against the first rows
+    owned by the rank at the south end of the same column of ranks, so the check also holds across
+    ranks split in y.
+    """
+
+    # BCs that can introduce y-variation at the first ghost-cell update
+    bc_ok = all(
+        t in ("periodic", "outflow", "extrap")
+        for t in config.bc.south.types + config.bc.north.types
+    )
+
+    # a roughness map from a file may vary in y and then make hu vary in y through friction
+    friction_ok = config.friction is None or config.friction.file is None
+
+    # the rank at the south end of this column of ranks broadcasts its first rows of w, hu, and b
+    q = states.q[(slice(None),)+states.domain.nonhalo_c]
+    v = topo.v[states.domain.nonhalo_v]
+    column = states.domain.comm.Sub([True, False])
+    qref, vref = column.bcast((q[:2, :1, :], v[:1, :]), root=0)
+    column.Free()
+
+    local_ok = bool(
+        nplike.all(v == vref) and nplike.all(q[2] == 0.) and nplike.all(q[:2] == qref)
+    )
+    local_ok = states.domain.comm.allreduce(local_ok, MPI.LAND)
+
+    return bc_ok and friction_ok and config.ptsource is None and local_ok
+
+
 def get_runtime(comm, config, logger):
     """Get a runtime object.
     """
@@ -242,6 +288,15 @@ def get_runtime(comm, config, logger):
         runtime.topo.c[states.domain.nonhalo_c], states.q[(0,)+states.domain.nonhalo_c])
     states.check()
 
+    # the y-direction terms are skipped in 1D mode, so the problem must really be invariant in y
+    if config.spatial.one_d:
+        if not is_invariant_in_y(states, runtime.topo, config):
+            raise ValueError(
+                "spatial.one_d requires topography and ICs invariant in y, zero hv, no point "
+                "source, no roughness file, and periodic/outflow/extrap BCs on the south and "
+                "north boundaries")
+        logger.info("1D mode: y-direction fluxes, speeds, and CFL constraint are skipped")
+
     runtime.dt = config.temporal.dt  # time step size; may be changed during runtime
     logger.info("Initial dt: %e", runtime.dt)
 
@@ -292,6 +347,9 @@ def get_runtime(comm, config, logger):
         logger.info("Friction fucntion added to stiff source terms")
         logger.info("Friction coefficient model: %s", config.friction.model)
 
+    runtime.rhs_preparer = get_rhs_preparer(states, runtime, config)  # sources are fixed now
+    logger.info("Done generating the right-hand-side preparer")
+
     return states, runtime
 
 
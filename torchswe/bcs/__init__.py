@@ -32,6 +32,51 @@ else:
     from ._cython_const_val import const_val_bc_factory  # pylint: disable=no-name-in-module
     from ._cython_inflow import inflow_bc_factory  # pylint: disable=no-name-in-module
 
+# the order of boundaries used when building ghost cell updaters, and a getter of their BCConfigs
+_ORIENTATIONS = ("west", "east", "south", "north")
+_BC_GETTER = _itemgetter(*_ORIENTATIONS)
+
+# dispatch table from BC types to factories with a common signature (ornt, comp, states, topo, val)
+_BC_FACTORY = {
+    # constant extrapolation BC (outflow)
+    "outflow": lambda ornt, comp, states, topo, val: outflow_bc_factory(ornt, comp, states, topo),
+    # linear extrapolation BC
+    "extrap": lambda ornt, comp, states, topo, val: linear_extrap_bc_factory(
+        ornt, comp, states, topo),
+    # constant, i.e., Dirichlet
+    "const": const_val_bc_factory,
+    # inflow, i.e., constant non-conservative variables
+    "inflow": inflow_bc_factory,
+}
+
+
+def _build_updater(funcs):
+    """Generate a function that calls all ghost-cell updaters in straight-line code.
+
+    Arguments
+    ---------
+    funcs : a tuple of callables
+        The updaters of the individual boundaries and components. They take no arguments.
+
+    Returns
+    -------
+    A callable with signature `torchswe.utils.data.States = func(torchswe.utils.data.States)`.
+
+    Notes
+    -----
+    The calls are unrolled in the generated source code, so applying all BCs in a time step does
+    not need a Python-level loop or any attribute or item look-ups.
+    """
+
+    src = ["def updater(soln):"]
+    src.extend(f"    _func{i}()" for i in range(len(funcs)))
+    src.append("    return soln")
+
+    namespace = {f"_func{i}": func for i, func in enumerate(funcs)}
+    code = compile("\n".join(src), "<ghost-cell-updater>", "exec")
+    exec(code, namespace)  # pylint: disable=exec-used
+    return namespace["updater"]
+
 
 def get_ghost_cell_updaters(states: _States, topo: _Topography, bcs: _BCConfig):
     """A function factory returning a function that updates all ghost cells.
@@ -61,9 +106,8 @@ def get_ghost_cell_updaters(states: _States, topo: _Topography, bcs: _BCConfig):
 
     bcs.check()
     funcs = []  # can be either a list or ordered dict, cannot be an unordered dict
-    orientations = ["west", "east", "south", "north"]
 
-    for ornt, bc in zip(orientations, _itemgetter(*orientations)(bcs)):
+    for ornt, bc in zip(_ORIENTATIONS, _BC_GETTER(bcs)):
 
         # not on the physical boundary: skip
         # ----------------------------------
@@ -81,34 +125,21 @@ def get_ghost_cell_updaters(states: _States, topo: _Topography, bcs: _BCConfig):
         # ----------------------
         for i, (bctp, bcv) in enumerate(zip(bc.types, bc.values)):
 
-            # constant extrapolation BC (outflow)
-            if bctp == "outflow":
-                funcs.append(outflow_bc_factory(ornt, i, states, topo))
+            try:
+                factory = _BC_FACTORY[bctp]
+            except KeyError as err:  # shouldn't happen because pydantic should have catched it
+                raise ValueError(f"{bctp} is not recognized.") from err
 
-            # linear extrapolation BC
-            elif bctp == "extrap":
-                funcs.append(linear_extrap_bc_factory(ornt, i, states, topo))
-
-            # constant, i.e., Dirichlet
-            elif bctp == "const":
-                funcs.append(const_val_bc_factory(ornt, i, states, topo, bcv))
-
-            # inflow, i.e., constant non-conservative variables
-            elif bctp == "inflow":
-                funcs.append(inflow_bc_factory(ornt, i, states, topo, bcv))
-
-            # this shouldn't happen because pydantic should have catched the error
-            else:
-                raise ValueError(f"{bctp} is not recognized.")
+            funcs.append(factory(ornt, i, states, topo, bcv))
 
     # check the data model in case neighbors changed due to periodic BC
     states.check()
 
+    # the collection of BC functions is fixed from now on
+    funcs = tuple(funcs)
+
     # this is the function that will be retuned by this function factory
-    def updater(soln: _States):
-        for func in funcs:  # if funcs is an empty list, this will skip it
-            func()
-        return soln
+    updater = _build_updater(funcs)  # if funcs is an empty list, it simply returns soln
 
     # store the functions as an attribute for debug
     updater.funcs = funcs
@@ -16,12 +16,20 @@ if _TYPE_CHECKING:  # if we are having type checking, then we import correspondi
     from torchswe.utils.data import States
 
 # pylint: disable=wrong-import-position, ungrouped-imports
+import linecache as _linecache
+from itertools import count as _count
 from torchswe import nplike as _nplike
-from torchswe.kernels import get_discontinuous_flux as _get_discontinuous_flux
-from torchswe.kernels import central_scheme as _central_scheme
-from torchswe.kernels import get_local_speed as _get_local_speed
+from torchswe.kernels import get_flux_divergence as _get_flux_divergence
+from torchswe.kernels import get_max_local_speed as _get_max_local_speed
+from torchswe.kernels import get_numerical_flux as _get_numerical_flux
 from torchswe.kernels import reconstruct as _reconstruct
 
+# created once and reused by all prepare_rhs calls (not re-entrant, but prepare_rhs is not either)
+_ignore_divide = _nplike.errstate(divide="ignore")
+
+# a counter to give each generated preparer a unique pseudo file name for tracebacks
+_preparer_ids = _count()
+
 
 def prepare_rhs(states: States, runtime: DummyDict, config: Config):
     """Get the right-hand-side of a time-marching step for SWE.
@@ -40,27 +48,22 @@ def prepare_rhs(states: States, runtime: DummyDict, config: Config):
         A scalar indicating the maximum time-step size if we consider CFL to be one. Note, it
         does not mean this time-step size is safe. Whether it's safe or not depending on the
         allowed CFL of the implemented scheme.
+
+    Notes
+    -----
+    Time-marching schemes use the specialized `runtime.rhs_preparer` from `get_rhs_preparer`,
+    which must do the same steps as this function. tests/core/test_fvm.py checks that they agree.
     """
 
     # reconstruct conservative and non-conservative quantities at cell interfaces
     states = _reconstruct(states, runtime, config)
 
-    # get local speed at cell faces
-    states = _get_local_speed(states, config.params.gravity)
-
-    # get discontinuous PDE flux at cell faces
-    states = _get_discontinuous_flux(states, config.params.gravity)
+    # get local speed and common/continuous numerical flux at cell faces (fused on GPUs); faces
+    # normal to y are skipped if solutions are invariant in y
+    states = _get_numerical_flux(states, config.params.gravity, config.spatial.one_d)
 
-    # get common/continuous numerical flux at cell faces
-    states = _central_scheme(states)
-
-    # aliases
-    dy, dx = states.domain.delta
-
-    # get right-hand-side contributed by spatial derivatives
-    states.s = \
-        (states.face.x.cf[:, :, :-1] - states.face.x.cf[:, :, 1:]) / dx + \
-        (states.face.y.cf[:, :-1, :] - states.face.y.cf[:, 1:, :]) / dy
+    # get right-hand-side contributed by spatial derivatives (overwrites states.s in-place)
+    states = _get_flux_divergence(states, config.spatial.one_d)
 
     # add explicit source terms in-place to states.S
     for func in runtime.sources:
@@ -70,11 +73,86 @@ def prepare_rhs(states: States, runtime: DummyDict, config: Config):
     for func in runtime.stiff_sources:
         states = func(states, runtime, config)
 
-    # obtain the maximum safe dt
-    amax = _nplike.max(_nplike.maximum(states.face.x.plus.a, -states.face.x.minus.a))
-    bmax = _nplike.max(_nplike.maximum(states.face.y.plus.a, -states.face.y.minus.a))
+    # aliases
+    dy, dx = states.domain.delta
+
+    # obtain the maximum safe dt; if solutions are invariant in y, only x-direction speeds matter
+    amax = _get_max_local_speed(states.face.x)
 
-    with _nplike.errstate(divide="ignore"):
-        max_dt = min(dx/amax, dy/bmax)  # may be a `inf` (but never `NaN`)
+    with _ignore_divide:
+        if config.spatial.one_d:
+            max_dt = dx / amax  # may be a `inf` (but never `NaN`)
+        else:
+            bmax = _get_max_local_speed(states.face.y)
+            max_dt = min(dx/amax, dy/bmax)  # may be a `inf` (but never `NaN`)
 
     return states, max_dt
+
+
+def get_rhs_preparer(states: States, runtime: DummyDict, config: Config):
+    """A function factory returning a version of `prepare_rhs` specialized for this simulation.
+
+    Arguments
+    ---------
+    states : torchswe.utils.data.States
+        The States instance that will be used in the simulation. Only its grid spacing is used.
+    runtime : torchswe.utils.misc.DummyDict
+        Must already have `sources` and `stiff_sources`; they are fixed from now on.
+    config : torchswe.utils.config.Config
+
+    Returns
+    -------
+    A callable with the same signature and returns as `prepare_rhs`.
+
+    Notes
+    -----
+    The source terms are unrolled, and the gravity, grid spacing, and `one_d` branch are bound as
+    constants in the generated source code, so a time step does not need Python-level loops,
+    branches, or attribute look-ups for them. The generated source is registered in `linecache`,
+    so tracebacks through it show the offending lines.
+    """
+
+    funcs = tuple(runtime.sources) + tuple(runtime.stiff_sources)
+    one_d = bool(config.spatial.one_d)
+
+    src = [
+        "def prepare_rhs(states, runtime, config):",
+        "    states = _reconstruct(states, runtime, config)",
+        f"    states = _get_numerical_flux(states, _gravity, {one_d})",
+        f"    states = _get_flux_divergence(states, {one_d})",
+    ]
+    src.extend(f"    states = _func{i}(states, runtime, config)" for i in range(len(funcs)))
+    src.append("    amax = _get_max_local_speed(states.face.x)")
+
+    if one_d:
+        src.append("    with _ignore_divide:")
+        src.append("        max_dt = _dx / amax")
+    else:
+        src.append("    bmax = _get_max_local_speed(states.face.y)")
+        src.append("    with _ignore_divide:")
+        src.append("        max_dt = min(_dx/amax, _dy/bmax)")
+
+    src.append("    return states, max_dt")
+    src = "\n".join(src) + "\n"
+
+    dy, dx = states.domain.delta
+    namespace = {f"_func{i}": func for i, func in enumerate(funcs)}
+    namespace.update(
+        _reconstruct=_reconstruct, _get_numerical_flux=_get_numerical_flux,
+        _get_flux_divergence=_get_flux_divergence, _get_max_local_speed=_get_max_local_speed,
+        _ignore_divide=_ignore_divide, _gravity=config.params.gravity, _dx=dx, _dy=dy,
+    )
+
+    # register the source so tracebacks and debuggers can show it; mtime None keeps it cached
+    filename = f"<rhs-preparer-{next(_preparer_ids)}>"
+    _linecache.cache[filename] = (len(src), None, src.splitlines(True), filename)
+
+    code = compile(src, filename, "exec")
+    exec(code, namespace)  # pylint: disable=exec-used
+    preparer = namespace["prepare_rhs"]
+
+    # store the source-term functions and the generated source as attributes for debug
+    preparer.funcs = funcs
+    preparer.source = src
+
+    return preparer
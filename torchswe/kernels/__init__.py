@@ -15,7 +15,10 @@ if "LEGATE_MAX_DIM" in _os.environ and "LEGATE_MAX_FIELDS" in _os.environ:
 elif "USE_CUPY" in _os.environ and _os.environ["USE_CUPY"] == "1":
     from .cupy import get_discontinuous_flux
     from .cupy import central_scheme
+    from .cupy import get_flux_divergence
     from .cupy import get_local_speed
+    from .cupy import get_max_local_speed
+    from .cupy import get_numerical_flux
     from .cupy import reconstruct
     from .cupy import reconstruct_cell_centers
 elif "USE_TORCH" in _os.environ and _os.environ["USE_TORCH"] == "1":
@@ -23,6 +26,9 @@ elif "USE_TORCH" in _os.environ and _os.environ["USE_TORCH"] == "1":
 else:
     from .cython import get_discontinuous_flux
     from .cython import central_scheme
+    from .cython import get_flux_divergence
     from .cython import get_local_speed
+    from .cython import get_max_local_speed
+    from .cython import get_numerical_flux
     from .cython import reconstruct
     from .cython import reconstruct_cell_centers
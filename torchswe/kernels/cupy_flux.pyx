@@ -27,13 +27,15 @@ cdef get_discontinuous_flux_y = cupy.ElementwiseKernel(
 )
 
 
-def get_discontinuous_flux(object states, double gravity):
+def get_discontinuous_flux(object states, double gravity, bint one_d=False):
     """Calculting the discontinuous fluxes on the both sides at cell faces.
 
     Arguments
     ---------
     states : torchswe.utils.data.States
     gravity : float
+    one_d : bool
+        Whether the solutions are invariant in y. If so, faces normal to y are skipped.
 
     Returns
     -------
@@ -55,6 +57,9 @@ def get_discontinuous_flux(object states, double gravity):
     get_discontinuous_flux_x(xm.q[1], xm.p[0], xm.p[1], xm.p[2], grav2, xm.f[0], xm.f[1], xm.f[2])
     get_discontinuous_flux_x(xp.q[1], xp.p[0], xp.p[1], xp.p[2], grav2, xp.f[0], xp.f[1], xp.f[2])
 
+    if one_d:
+        return states
+
     # face normal to y-direction: [hv, huv, hv^2+g(h^2)/2]
     get_discontinuous_flux_y(ym.q[2], ym.p[0], ym.p[1], ym.p[2], grav2, ym.f[0], ym.f[1], ym.f[2])
     get_discontinuous_flux_y(yp.q[2], yp.p[0], yp.p[1], yp.p[2], grav2, yp.f[0], yp.f[1], yp.f[2])
@@ -75,12 +80,14 @@ cdef central_scheme_kernel = cupy.ElementwiseKernel(
 )
 
 
-def central_scheme(object states):
+def central_scheme(object states, bint one_d=False):
     """A central scheme to calculate numerical flux at interfaces.
 
     Arguments
     ---------
     states : torchswe.utils.data.States
+    one_d : bool
+        Whether the solutions are invariant in y. If so, faces normal to y are skipped.
 
     Returns
     -------
@@ -97,7 +104,187 @@ def central_scheme(object states):
     yp = y.plus
 
     central_scheme_kernel(xm.a, xp.a, xm.f, xp.f, xm.q, xp.q, x.cf)
-    central_scheme_kernel(ym.a, yp.a, ym.f, yp.f, ym.q, yp.q, y.cf)
+    if not one_d:
+        central_scheme_kernel(ym.a, yp.a, ym.f, yp.f, ym.q, yp.q, y.cf)
+
+    return states
+
+
+# raw CUDA kernel of local speeds so the fused numerical-flux kernels can reuse it;
+# `unm` and `unp` are the face-normal velocities on the two sides
+_local_speed_raw_kernel = r"""
+    template<typename T> __inline__ __device__
+    void _local_speed_raw_kernel(
+        const T &hm, const T &hp, const T &unm, const T &unp, const T &g, T &am, T &ap
+    ) {
+        T ghm = sqrt(g * hm);
+        T ghp = sqrt(g * hp);
+        ap = max(max(unp+ghp, unm+ghm), 0.0);
+        am = min(min(unp-ghp, unm-ghm), 0.0);
+    }
+"""
+
+
+cdef numerical_flux_x_kernel = cupy.ElementwiseKernel(
+    "T hm, T um, T vm, T wm, T hum, T hvm, T hp, T up, T vp, T wp, T hup, T hvp, T g",
+    "T am, T ap, T h0, T h1, T h2",
+    r"""
+        _local_speed_raw_kernel(hm, hp, um, up, g, am, ap);
+        T denominator = ap - am;
+
+        if (denominator == 0.0) {  // implying both ap and am are zero
+            h0 = 0.0;
+            h1 = 0.0;
+            h2 = 0.0;
+        } else {
+            T grav2 = g / 2.0;
+            T coeff = ap * am;
+            h0 = (ap * hum - am * hup + coeff * (wp - wm)) / denominator;
+            h1 = (
+                ap * (hum * um + grav2 * hm * hm) - am * (hup * up + grav2 * hp * hp) +
+                coeff * (hup - hum)
+            ) / denominator;
+            h2 = (ap * hum * vm - am * hup * vp + coeff * (hvp - hvm)) / denominator;
+        }
+    """,
+    "numerical_flux_x_kernel",
+    preamble=_local_speed_raw_kernel
+)
+
+
+cdef numerical_flux_y_kernel = cupy.ElementwiseKernel(
+    "T hm, T um, T vm, T wm, T hum, T hvm, T hp, T up, T vp, T wp, T hup, T hvp, T g",
+    "T am, T ap, T h0, T h1, T h2",
+    r"""
+        _local_speed_raw_kernel(hm, hp, vm, vp, g, am, ap);
+        T denominator = ap - am;
+
+        if (denominator == 0.0) {  // implying both ap and am are zero
+            h0 = 0.0;
+            h1 = 0.0;
+            h2 = 0.0;
+        } else {
+            T grav2 = g / 2.0;
+            T coeff = ap * am;
+            h0 = (ap * hvm - am * hvp + coeff * (wp - wm)) / denominator;
+            h1 = (ap * hvm * um - am * hvp * up + coeff * (hup - hum)) / denominator;
+            h2 = (
+                ap * (hvm * vm + grav2 * hm * hm) - am * (hvp * vp + grav2 * hp * hp) +
+                coeff * (hvp - hvm)
+            ) / denominator;
+        }
+    """,
+    "numerical_flux_y_kernel",
+    preamble=_local_speed_raw_kernel
+)
+
+
+def get_numerical_flux(object states, double gravity, bint one_d=False):
+    """Calculate local speeds and common/numerical fluxes at cell faces in one pass.
+
+    This is equivalent to calling `get_local_speed`, `get_discontinuous_flux`, and
+    `central_scheme` in order, except that the discontinuous fluxes are evaluated on the fly
+    and are not written back to `states.face.{x,y}.{plus,minus}.f`.
+
+    Arguments
+    ---------
+    states : torchswe.utils.data.States
+    gravity : float
+        Gravity in m / s^2.
+    one_d : bool
+        Whether the solutions are invariant in y. If so, faces normal to y are skipped.
+
+    Returns
+    -------
+    states : torchswe.utils.data.States
+        The same object as the input. Changed inplace. Returning it just for coding style.
+    """
+
+    # alias to reduce dictionary look-up
+    cdef object face = states.face;
+    cdef object fx = face.x;
+    cdef object fy = face.y;
+    cdef object xm = fx.minus;
+    cdef object xp = fx.plus;
+    cdef object ym = fy.minus;
+    cdef object yp = fy.plus;
+    cdef object xmU = xm.p;
+    cdef object xpU = xp.p;
+    cdef object ymU = ym.p;
+    cdef object ypU = yp.p;
+    cdef object xmQ = xm.q;
+    cdef object xpQ = xp.q;
+    cdef object ymQ = ym.q;
+    cdef object ypQ = yp.q;
+    cdef object xH = fx.cf;
+    cdef object yH = fy.cf;
+
+    numerical_flux_x_kernel(
+        xmU[0], xmU[1], xmU[2], xmQ[0], xmQ[1], xmQ[2],
+        xpU[0], xpU[1], xpU[2], xpQ[0], xpQ[1], xpQ[2],
+        gravity, xm.a, xp.a, xH[0], xH[1], xH[2]
+    )
+
+    if one_d:
+        return states
+
+    numerical_flux_y_kernel(
+        ymU[0], ymU[1], ymU[2], ymQ[0], ymQ[1], ymQ[2],
+        ypU[0], ypU[1], ypU[2], ypQ[0], ypQ[1], ypQ[2],
+        gravity, ym.a, yp.a, yH[0], yH[1], yH[2]
+    )
+
+    return states
+
+
+cdef flux_divergence_kernel = cupy.ElementwiseKernel(
+    "T hw, T he, T hs, T hn, float64 inv_dx, float64 inv_dy",
+    "T s",
+    """
+        s = (hw - he) * inv_dx + (hs - hn) * inv_dy;
+    """,
+    "flux_divergence_kernel"
+)
+
+
+cdef flux_divergence_x_kernel = cupy.ElementwiseKernel(
+    "T hw, T he, float64 inv_dx",
+    "T s",
+    """
+        s = (hw - he) * inv_dx;
+    """,
+    "flux_divergence_x_kernel"
+)
+
+
+def get_flux_divergence(object states, bint one_d=False):
+    """Calculate the right-hand-side contributed by the common/numerical fluxes at cell faces.
+
+    Arguments
+    ---------
+    states : torchswe.utils.data.States
+    one_d : bool
+        Whether the solutions are invariant in y. If so, the y-direction flux differences are
+        zeros and are skipped.
+
+    Returns
+    -------
+    states : torchswe.utils.data.States
+        The same object as the input. `states.s` is overwritten in-place. Returning it just for
+        coding style.
+    """
+
+    xH = states.face.x.cf
+    yH = states.face.y.cf
+
+    dy, dx = states.domain.delta
+
+    # multiplications are cheaper than divisions
+    if one_d:
+        flux_divergence_x_kernel(xH[:, :, :-1], xH[:, :, 1:], 1. / dx, states.s)
+    else:
+        flux_divergence_kernel(
+            xH[:, :, :-1], xH[:, :, 1:], yH[:, :-1, :], yH[:, 1:, :], 1. / dx, 1. / dy, states.s)
 
     return states
 
@@ -115,7 +302,7 @@ cdef get_local_speed_kernel = cupy.ElementwiseKernel(
 )
 
 
-def get_local_speed(object states, double gravity):
+def get_local_speed(object states, double gravity, bint one_d=False):
     """Calculate local speeds on the two sides of cell faces.
 
     Arguments
@@ -123,6 +310,8 @@ def get_local_speed(object states, double gravity):
     states : torchswe.utils.data.States
     gravity : float
         Gravity in m / s^2.
+    one_d : bool
+        Whether the solutions are invariant in y. If so, faces normal to y are skipped.
 
     Returns
     -------
@@ -149,6 +338,43 @@ def get_local_speed(object states, double gravity):
 
     # faces normal to x- and y-directions
     get_local_speed_kernel(xpU[0], xmU[0], xpU[1], xmU[1], gravity, xpa, xma)
-    get_local_speed_kernel(ypU[0], ymU[0], ypU[2], ymU[2], gravity, ypa, yma)
+    if not one_d:
+        get_local_speed_kernel(ypU[0], ymU[0], ypU[2], ymU[2], gravity, ypa, yma)
 
     return states
+
+
+cdef max_local_speed_kernel = cupy.ReductionKernel(
+    "T ap, T am",
+    "T amax",
+    "max(ap, abs(am))",  # am <= 0 by construction, so abs(am) == -am
+    "max(a, b)",
+    "amax = a",
+    "0",
+    "max_local_speed_kernel"
+)
+
+
+def get_max_local_speed(object face):
+    """Get the maximum absolute local speed on cell faces normal to one direction.
+
+    Arguments
+    ---------
+    face : torchswe.utils.data.states.FaceTwoSideModel
+        For example, `states.face.x` or `states.face.y`.
+
+    Returns
+    -------
+    amax : 0-d cupy.ndarray
+        The maximum speed.
+    """
+    ap = face.plus.a
+    am = face.minus.a
+
+    # the abs() in the reduction relies on these signs; checked only when debugging as it's costly
+    if _logger.isEnabledFor(logging.DEBUG):
+        assert (ap >= 0.).all(), "plus.a must be non-negative."
+        assert (am <= 0.).all(), "minus.a must be non-positive."
+
+    # abs, comparison, and reduction are done in a single kernel launch
+    return max_local_speed_kernel(ap, am)
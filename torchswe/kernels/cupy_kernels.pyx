@@ -2,7 +2,10 @@
 # vim:ft=pyrex
 
 
+import logging
 import cupy
 cimport cython
+
+_logger = logging.getLogger("torchswe.kernels")
 include "cupy_flux.pyx"
 include "cupy_reconstruction.pyx"
@@ -61,13 +61,15 @@ cdef void get_discontinuous_flux_y(
             F[2, j, i] = Q[2, j, i] * U[2, j, i] + grav2 * U[0, j, i] * U[0, j, i]
 
 
-def get_discontinuous_flux(object states, double gravity):
+def get_discontinuous_flux(object states, double gravity, bint one_d=False):
     """Calculting the discontinuous fluxes on the both sides at cell faces.
 
     Arguments
     ---------
     states : torchswe.utils.data.States
     gravity : float
+    one_d : bool
+        Whether the solutions are invariant in y. If so, faces normal to y are skipped.
 
     Returns
     -------
@@ -101,16 +103,18 @@ def get_discontinuous_flux(object states, double gravity):
         get_discontinuous_flux_x[cython.float](xpF, xpQ, xpU, gravity)
 
         # face normal to y-direction: [hv, huv, hv^2+g(h^2)/2]
-        get_discontinuous_flux_y[cython.float](ymF, ymQ, ymU, gravity)
-        get_discontinuous_flux_y[cython.float](ypF, ypQ, ypU, gravity)
+        if not one_d:
+            get_discontinuous_flux_y[cython.float](ymF, ymQ, ymU, gravity)
+            get_discontinuous_flux_y[cython.float](ypF, ypQ, ypU, gravity)
     elif dtype == numpy.double:
         # face normal to x-direction: [hu, hu^2 + g(h^2)/2, huv]
         get_discontinuous_flux_x[cython.double](xmF, xmQ, xmU, gravity)
         get_discontinuous_flux_x[cython.double](xpF, xpQ, xpU, gravity)
 
         # face normal to y-direction: [hv, huv, hv^2+g(h^2)/2]
-        get_discontinuous_flux_y[cython.double](ymF, ymQ, ymU, gravity)
-        get_discontinuous_flux_y[cython.double](ypF, ypQ, ypU, gravity)
+        if not one_d:
+            get_discontinuous_flux_y[cython.double](ymF, ymQ, ymU, gravity)
+            get_discontinuous_flux_y[cython.double](ypF, ypQ, ypU, gravity)
     else:
         raise RuntimeError(f"Arrays are using an unrecognized dtype: {dtype}.")
 
@@ -153,12 +157,14 @@ cdef void central_scheme_kernel(
                 ) / denominator
 
 
-def central_scheme(object states):
+def central_scheme(object states, bint one_d=False):
     """A central scheme to calculate numerical flux at interfaces.
 
     Arguments
     ---------
     states : torchswe.utils.data.States
+    one_d : bool
+        Whether the solutions are invariant in y. If so, faces normal to y are skipped.
 
     Returns
     -------
@@ -192,10 +198,116 @@ def central_scheme(object states):
 
     if dtype == numpy.single:
         central_scheme_kernel[cython.float](xH, xmQ, xpQ, xmF, xpF, xma, xpa)
-        central_scheme_kernel[cython.float](yH, ymQ, ypQ, ymF, ypF, yma, ypa)
+        if not one_d:
+            central_scheme_kernel[cython.float](yH, ymQ, ypQ, ymF, ypF, yma, ypa)
     elif dtype == numpy.double:
         central_scheme_kernel[cython.double](xH, xmQ, xpQ, xmF, xpF, xma, xpa)
-        central_scheme_kernel[cython.double](yH, ymQ, ypQ, ymF, ypF, yma, ypa)
+        if not one_d:
+            central_scheme_kernel[cython.double](yH, ymQ, ypQ, ymF, ypF, yma, ypa)
+    else:
+        raise RuntimeError(f"Arrays are using an unrecognized dtype: {dtype}.")
+
+    return states
+
+
+def get_numerical_flux(object states, double gravity, bint one_d=False):
+    """Calculate local speeds and common/numerical fluxes at cell faces.
+
+    This is equivalent to calling `get_local_speed`, `get_discontinuous_flux`, and
+    `central_scheme` in order. It exists so that the CuPy backend, which fuses the three stages
+    into a single kernel, and this backend share the same interface.
+
+    Arguments
+    ---------
+    states : torchswe.utils.data.States
+    gravity : float
+        Gravity in m / s^2.
+    one_d : bool
+        Whether the solutions are invariant in y. If so, faces normal to y are skipped.
+
+    Returns
+    -------
+    states : torchswe.utils.data.States
+        The same object as the input. Changed inplace. Returning it just for coding style.
+    """
+    states = get_local_speed(states, gravity, one_d)
+    states = get_discontinuous_flux(states, gravity, one_d)
+    states = central_scheme(states, one_d)
+    return states
+
+
+cdef void flux_divergence_kernel(
+    cython.floating[:, :, ::1] S,
+    cython.floating[:, :, ::1] Hx,  # TODO: read-only buffer
+    cython.floating[:, :, ::1] Hy,  # TODO: read-only buffer
+    const double dx,
+    const double dy
+) nogil except *:
+    """Kernel calculating the right-hand-side contributed by numerical fluxes (in-place).
+    """
+    cdef Py_ssize_t nx = S.shape[2]
+    cdef Py_ssize_t ny = S.shape[1]
+    cdef Py_ssize_t k, j, i
+    cdef cython.floating inv_dx = 1.0 / dx  # multiplications are cheaper than divisions
+    cdef cython.floating inv_dy = 1.0 / dy
+
+    for k in range(3):
+        for j in range(ny):
+            for i in range(nx):
+                S[k, j, i] = \
+                    (Hx[k, j, i] - Hx[k, j, i+1]) * inv_dx + (Hy[k, j, i] - Hy[k, j+1, i]) * inv_dy
+
+
+cdef void flux_divergence_x_kernel(
+    cython.floating[:, :, ::1] S,
+    cython.floating[:, :, ::1] Hx,  # TODO: read-only buffer
+    const double dx
+) nogil except *:
+    """Kernel calculating the right-hand-side contributed by only x-direction fluxes (in-place).
+    """
+    cdef Py_ssize_t nx = S.shape[2]
+    cdef Py_ssize_t ny = S.shape[1]
+    cdef Py_ssize_t k, j, i
+    cdef cython.floating inv_dx = 1.0 / dx  # multiplications are cheaper than divisions
+
+    for k in range(3):
+        for j in range(ny):
+            for i in range(nx):
+                S[k, j, i] = (Hx[k, j, i] - Hx[k, j, i+1]) * inv_dx
+
+
+def get_flux_divergence(object states, bint one_d=False):
+    """Calculate the right-hand-side contributed by the common/numerical fluxes at cell faces.
+
+    Arguments
+    ---------
+    states : torchswe.utils.data.States
+    one_d : bool
+        Whether the solutions are invariant in y. If so, the y-direction flux differences are
+        zeros and are skipped.
+
+    Returns
+    -------
+    states : torchswe.utils.data.States
+        The same object as the input. `states.s` is overwritten in-place. Returning it just for
+        coding style.
+    """
+    S = states.s
+    xH = states.face.x.cf
+    yH = states.face.y.cf
+
+    dy, dx = states.domain.delta
+
+    dtype = S.dtype
+
+    if one_d and dtype == numpy.single:
+        flux_divergence_x_kernel[cython.float](S, xH, dx)
+    elif one_d and dtype == numpy.double:
+        flux_divergence_x_kernel[cython.double](S, xH, dx)
+    elif dtype == numpy.single:
+        flux_divergence_kernel[cython.float](S, xH, yH, dx, dy)
+    elif dtype == numpy.double:
+        flux_divergence_kernel[cython.double](S, xH, yH, dx, dy)
     else:
         raise RuntimeError(f"Arrays are using an unrecognized dtype: {dtype}.")
 
@@ -224,7 +336,7 @@ cdef void local_speed_kernel(
             am[j, i] = min(min(up[j, i]-sqrt_ghp, um[j, i]-sqrt_ghm), 0.0)
 
 
-def get_local_speed(object states, double gravity):
+def get_local_speed(object states, double gravity, bint one_d=False):
     """Calculate local speeds on the two sides of cell faces.
 
     Arguments
@@ -232,6 +344,8 @@ def get_local_speed(object states, double gravity):
     states : torchswe.utils.data.States
     gravity : float
         Gravity in m / s^2.
+    one_d : bool
+        Whether the solutions are invariant in y. If so, faces normal to y are skipped.
 
     Returns
     -------
@@ -251,14 +365,76 @@ def get_local_speed(object states, double gravity):
     if dtype == numpy.single:
         local_speed_kernel[cython.float](
             xm.a, xp.a, xm.p[0], xp.p[0], xm.p[1], xp.p[1], gravity)
-        local_speed_kernel[cython.float](
-            ym.a, yp.a, ym.p[0], yp.p[0], ym.p[2], yp.p[2], gravity)
+        if not one_d:
+            local_speed_kernel[cython.float](
+                ym.a, yp.a, ym.p[0], yp.p[0], ym.p[2], yp.p[2], gravity)
     elif dtype == numpy.double:
         local_speed_kernel[cython.double](
             xm.a, xp.a, xm.p[0], xp.p[0], xm.p[1], xp.p[1], gravity)
-        local_speed_kernel[cython.double](
-            ym.a, yp.a, ym.p[0], yp.p[0], ym.p[2], yp.p[2], gravity)
+        if not one_d:
+            local_speed_kernel[cython.double](
+                ym.a, yp.a, ym.p[0], yp.p[0], ym.p[2], yp.p[2], gravity)
     else:
         raise RuntimeError(f"Arrays are using an unrecognized dtype: {dtype}.")
 
     return states
+
+
+cdef cython.floating max_local_speed_kernel(
+    cython.floating[:, ::1] ap,  # TODO: read-only buffer
+    cython.floating[:, ::1] am  # TODO: read-only buffer
+) nogil except *:
+    """Kernel returning max(max(ap, abs(am))) without creating temporary arrays.
+
+    Since am <= 0 by construction, abs(am) == -am; abs only clears the sign bit.
+    """
+    cdef Py_ssize_t ny = ap.shape[0]
+    cdef Py_ssize_t nx = ap.shape[1]
+    cdef Py_ssize_t i, j
+    cdef cython.floating ans = 0.0  # ap >= 0 by construction, so 0 is a safe initial value
+
+    for j in range(ny):
+        for i in range(nx):
+            ans = max(ans, ap[j, i])
+
+    for j in range(ny):
+        for i in range(nx):
+            ans = max(ans, abs(am[j, i]))
+
+    return ans
+
+
+def get_max_local_speed(object face):
+    """Get the maximum absolute local speed on cell faces normal to one direction.
+
+    Arguments
+    ---------
+    face : torchswe.utils.data.states.FaceTwoSideModel
+        For example, `states.face.x` or `states.face.y`.
+
+    Returns
+    -------
+    amax : numpy.single or numpy.double
+        The maximum speed. It is a NumPy scalar (rather than a Python float) so that dividing by a
+        zero speed follows NumPy's `errstate`.
+    """
+    # read the same arrays that the local-speed kernels write, rather than relying on them
+    # staying views of `face.a`
+    ap = face.plus.a
+    am = face.minus.a
+
+    # the abs() in the reduction relies on these signs; checked only when debugging as it's costly
+    if _logger.isEnabledFor(logging.DEBUG):
+        assert (ap >= 0.).all(), "plus.a must be non-negative."
+        assert (am <= 0.).all(), "minus.a must be non-positive."
+
+    dtype = ap.dtype
+
+    if dtype == numpy.single:
+        amax = max_local_speed_kernel[cython.float](ap, am)
+    elif dtype == numpy.double:
+        amax = max_local_speed_kernel[cython.double](ap, am)
+    else:
+        raise RuntimeError(f"Arrays are using an unrecognized dtype: {dtype}.")
+
+    return dtype.type(amax)
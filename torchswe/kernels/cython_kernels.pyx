@@ -2,9 +2,12 @@
 # vim:ft=pyrex
 
 
+import logging
 import numpy
 cimport numpy
 cimport cython
 
+_logger = logging.getLogger("torchswe.kernels")
+
 include "cython_flux.pyx"
 include "cython_reconstruction.pyx"
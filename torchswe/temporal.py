@@ -20,7 +20,6 @@ import copy as _copy
 import logging as _logging
 from mpi4py import MPI as _MPI
 from torchswe import nplike as _nplike
-from torchswe.fvm import prepare_rhs as _prepare_rhs
 from torchswe.utils.misc import exchange_states as _exchange_states
 from torchswe.kernels import reconstruct_cell_centers as _reconstruct_cell_centers
 
@@ -91,20 +90,21 @@ def euler(states: States, runtime: DummyDict, config: Config):
         runtime.dt_constraint = runtime.next_t - runtime.cur_t
 
         # Euler step
-        states, max_dt = _prepare_rhs(states, runtime, config)
+        states, max_dt = runtime.rhs_preparer(states, runtime, config)
 
         # adaptive dt based on CFL condition
         runtime.dt = adapter(runtime.dt, max_dt, runtime.cfl)  # may exceed next_t
 
-        # re-evaluate dt with other constraints; dt_constraint might be modified during _prepare_rhs
+        # re-evaluate dt with other constraints; dt_constraint might be modified during rhs_preparer
         runtime.dt = min(runtime.dt, runtime.dt_constraint)
 
         # synchronize dt across all ranks
         _nplike.sync()
         runtime.dt = states.domain.comm.allreduce(runtime.dt, _MPI.MIN)
 
-        # update
-        states.q[internal] += (states.s * runtime.dt)
+        # update; states.s is overwritten by the next rhs_preparer, so scaling it in-place is safe
+        states.s *= runtime.dt
+        states.q[internal] += states.s
         states = semi_implicit_step(states, internal, runtime.dt)
 
         # update values in halo-ring and ghost cells; also calculate cell-centered non-conservatives
@@ -180,12 +180,12 @@ def ssprk2(states: States, runtime: DummyDict, config: Config):
         runtime.dt_constraint = runtime.next_t - runtime.cur_t
 
         # stage 1: now states.rhs is RHS(u_{n})
-        states, max_dt = _prepare_rhs(states, runtime, config)
+        states, max_dt = runtime.rhs_preparer(states, runtime, config)
 
         # adaptive dt based on the CFL of 1st order Euler
         runtime.dt = adapter(runtime.dt, max_dt, runtime.cfl)  # may exceed next_t
 
-        # re-evaluate dt with other constraints; dt_constraint might be modified during _prepare_rhs
+        # re-evaluate dt with other constraints; dt_constraint might be modified during rhs_preparer
         runtime.dt = min(runtime.dt, runtime.dt_constraint)
 
         # synchronize dt across all ranks
@@ -193,7 +193,8 @@ def ssprk2(states: States, runtime: DummyDict, config: Config):
         runtime.dt = states.domain.comm.allreduce(runtime.dt, _MPI.MIN)
 
         # update for the first step; now states.q is u1 = u_{n} + dt * RHS(u_{n})
-        states.q[internal] += (states.s * runtime.dt)
+        states.s *= runtime.dt  # in-place to avoid a temporary; rhs_preparer overwrites it anyway
+        states.q[internal] += states.s
 
         # update values in halo-ring and ghost cells; also calculate cell-centered non-conservatives
         states = _exchange_states(states)
@@ -201,10 +202,12 @@ def ssprk2(states: States, runtime: DummyDict, config: Config):
         states = _reconstruct_cell_centers(states, runtime, config)
 
         # stage 2: now states.rhs is RHS(u^1)
-        states, _ = _prepare_rhs(states, runtime, config)
+        states, _ = runtime.rhs_preparer(states, runtime, config)
 
         # calculate u_{n+1} = (u_{n} + u^1 + dt * RHS(u^1)) / 2.
-        states.q[internal] += (prev_q + states.s * runtime.dt)
+        states.s *= runtime.dt
+        states.s += prev_q
+        states.q[internal] += states.s
         states.q /= 2  # doesn't matter whether ghost cells are also divided by 2
 
         # update values in halo-ring and ghost cells; also calculate cell-centered non-conservatives
@@ -285,12 +288,12 @@ def ssprk3(states: States, runtime: DummyDict, config: Config):
         runtime.dt_constraint = runtime.next_t - runtime.cur_t
 
         # stage 1: now states.rhs is RHS(u_{n})
-        states, max_dt = _prepare_rhs(states, runtime, config)
+        states, max_dt = runtime.rhs_preparer(states, runtime, config)
 
         # adaptive dt based on the CFL of 1st order Euler
         runtime.dt = adapter(runtime.dt, max_dt, runtime.cfl)  # may exceed next_t
 
-        # re-evaluate dt with other constraints; dt_constraint might be modified during _prepare_rhs
+        # re-evaluate dt with other constraints; dt_constraint might be modified during rhs_preparer
         runtime.dt = min(runtime.dt, runtime.dt_constraint)
 
         # synchronize dt across all ranks
@@ -298,7 +301,8 @@ def ssprk3(states: States, runtime: DummyDict, config: Config):
         runtime.dt = states.domain.comm.allreduce(runtime.dt, _MPI.MIN)
 
         # update for the first step; now states.q is u1 = u_{n} + dt * RHS(u_{n})
-        states.q[internal] += (states.s * runtime.dt)
+        states.s *= runtime.dt  # in-place to avoid a temporary; rhs_preparer overwrites it anyway
+        states.q[internal] += states.s
 
         # update values in halo-ring and ghost cells; also calculate cell-centered non-conservatives
         states = _exchange_states(states)
@@ -306,10 +310,12 @@ def ssprk3(states: States, runtime: DummyDict, config: Config):
         states = _reconstruct_cell_centers(states, runtime, config)
 
         # stage 2: now states.rhs is RHS(u^1)
-        states, _ = _prepare_rhs(states, runtime, config)
+        states, _ = runtime.rhs_preparer(states, runtime, config)
 
         # now states.q = u^2 = (3 * u_{n} + u^1 + dt * RHS(u^1)) / 4
-        states.q[internal] += (prev_q * 3. + states.s * runtime.dt)
+        states.s *= runtime.dt
+        states.s += prev_q * 3.
+        states.q[internal] += states.s
         states.q /= 4.
 
         # update values in halo-ring and ghost cells; also calculate cell-centered non-conservatives
@@ -318,10 +324,11 @@ def ssprk3(states: States, runtime: DummyDict, config: Config):
         states = _reconstruct_cell_centers(states, runtime, config)
 
         # stage 3: now states.rhs is RHS(u^2)
-        states, _ = _prepare_rhs(states, runtime, config)
+        states, _ = runtime.rhs_preparer(states, runtime, config)
 
         # now states.q = u_{n+1} = (u_{n} + 2 * u^2 + 2 * dt * RHS(u^1)) / 3
-        states.q[internal] += (states.s * runtime.dt)
+        states.s *= runtime.dt
+        states.q[internal] += states.s
         states.q *= 2.
         states.q[internal] += prev_q
         states.q /= 3.
@@ -81,11 +81,17 @@ class SpatialConfig(BaseConfig):
         The elements correspond the the bounds in west, east, south, and north.
     discretization : a list/tuple of 2 int
         The elements correspond the number of cells in west-east and south-north directions.
+    one_d : bool
+        Whether the solutions are invariant in the south-north direction. If so, local speeds,
+        fluxes, and flux differences on faces normal to y, as well as the CFL constraint in y, are
+        skipped. Requires south and north BCs of type periodic, outflow, or extrap, and no
+        roughness file. Default: False.
     """
     # pylint: disable=too-few-public-methods, no-self-argument, invalid-name, no-self-use
 
     domain: _Tuple[float, float, float, float]
     discretization: _Tuple[_conint(strict=True, gt=0), _conint(strict=True, gt=0)]
+    one_d: bool = False
 
     @_validator("domain")
     def domain_direction(cls, v):
@@ -117,14 +117,25 @@ class FaceTwoSideModel(_BaseConfig):
         Objects holding data on one side of each face.
     cf : nplike.ndarray of shape (3, ny+1, nx) or (3, ny, nx+1)
         An object holding common flux (i.e., continuous or numerical flux)
+    a : nplike.ndarray of shape (2, ny+1, nx) or (2, ny, nx+1)
+        The local speeds on both sides packed in one contiguous block. `plus.a` and `minus.a` are
+        the views `a[0]` and `a[1]`, so the two sides are adjacent in memory. Kernels always read
+        and write through `plus.a` and `minus.a`, so results stay correct even if the views break.
+
+    Notes
+    -----
+    By construction, `plus.a` >= 0 and `minus.a` <= 0 (the local speeds are clipped at zero). The
+    maximum-speed reductions rely on this and use `abs(minus.a)` instead of `-minus.a`. They assert
+    it on every call when the "torchswe.kernels" logger is enabled for DEBUG.
     """
 
     plus: FaceOneSideModel
     minus: FaceOneSideModel
     cf: _nplike.ndarray
+    a: _nplike.ndarray
 
     # validator
-    _val_valid_numbers = _validator("cf", allow_reuse=True)(_pydantic_val_nan_inf)
+    _val_valid_numbers = _validator("cf", "a", allow_reuse=True)(_pydantic_val_nan_inf)
 
     @_root_validator(pre=False, skip_on_failure=True)
     def _val_arrays(cls, values):  # pylint: disable=no-self-argument, no-self-use
@@ -132,7 +143,7 @@ class FaceTwoSideModel(_BaseConfig):
         # pylint: disable=invalid-name
 
         try:
-            plus, minus, cf = values["plus"], values["minus"], values["cf"]
+            plus, minus, cf, a = values["plus"], values["minus"], values["cf"], values["a"]
         except KeyError as err:
             raise AssertionError("Fix other fields first.") from err
 
@@ -140,6 +151,10 @@ class FaceTwoSideModel(_BaseConfig):
         assert plus.q.dtype == minus.q.dtype, f"dtype mismatch: {plus.q.dtype} and {minus.q.dtype}."
         assert plus.q.shape == cf.shape, f"Shape mismatch: {plus.q.shape} and {cf.shape}."
         assert plus.q.dtype == cf.dtype, f"dtype mismatch: {plus.q.dtype} and {cf.dtype}."
+        assert a.shape == (2,)+plus.a.shape, f"Shape mismatch: {a.shape} and {(2,)+plus.a.shape}."
+        assert a.dtype == plus.a.dtype, f"dtype mismatch: {a.dtype} and {plus.a.dtype}."
+        assert _nplike.may_share_memory(a[0], plus.a), "plus.a is not a view of a[0]."
+        assert _nplike.may_share_memory(a[1], minus.a), "minus.a is not a view of a[1]."
         return values
 
 
@@ -251,6 +266,7 @@ class States(_BaseConfig):
                     f: ndarray                              # shape: (3, ny, nx+1)
                 },
                 cf: ndarray                                  # shape: (3, ny, nx+1)
+                a: ndarray                                   # shape: (2, ny, nx+1)
             },
             y: {                                            # shape: (ny+1, nx)
                 plus: {
@@ -266,6 +282,7 @@ class States(_BaseConfig):
                     f: ndarray                              # shape: (3, ny+1, nx)
                 },
                 cf: ndarray                                  # shape: (3, ny+1, nx)
+                a: ndarray                                   # shape: (2, ny+1, nx)
             }
         },
         slpx: ndarray                                       # shape: (3, ny, nx+2)
@@ -492,37 +509,43 @@ def get_empty_states(config: Config, domain: Domain = None, comm: MPI.Comm = Non
     data.slpx = _nplike.zeros((3, ny, nx+2), dtype=dtype)
     data.slpy = _nplike.zeros((3, ny+2, nx), dtype=dtype)
 
+    # local speeds on both sides of faces share one allocation; plus.a and minus.a are its views
+    xa = _nplike.zeros((2, ny, nx+1), dtype=dtype)
+    ya = _nplike.zeros((2, ny+1, nx), dtype=dtype)
+
     # quantities on faces
     data.face = FaceQuantityModel(
         x=FaceTwoSideModel(
             plus=FaceOneSideModel(
                 q=_nplike.zeros((3, ny, nx+1), dtype=dtype),
                 p=_nplike.zeros((3, ny, nx+1), dtype=dtype),
-                a=_nplike.zeros((ny, nx+1), dtype=dtype),
+                a=xa[0],
                 f=_nplike.zeros((3, ny, nx+1), dtype)
             ),
             minus=FaceOneSideModel(
                 q=_nplike.zeros((3, ny, nx+1), dtype=dtype),
                 p=_nplike.zeros((3, ny, nx+1), dtype=dtype),
-                a=_nplike.zeros((ny, nx+1), dtype=dtype),
+                a=xa[1],
                 f=_nplike.zeros((3, ny, nx+1), dtype)
             ),
-            cf=_nplike.zeros((3, ny, nx+1), dtype)
+            cf=_nplike.zeros((3, ny, nx+1), dtype),
+            a=xa
         ),
         y=FaceTwoSideModel(
             plus=FaceOneSideModel(
                 q=_nplike.zeros((3, ny+1, nx), dtype=dtype),
                 p=_nplike.zeros((3, ny+1, nx), dtype=dtype),
-                a=_nplike.zeros((ny+1, nx), dtype=dtype),
+                a=ya[0],
                 f=_nplike.zeros((3, ny+1, nx), dtype)
             ),
             minus=FaceOneSideModel(
                 q=_nplike.zeros((3, ny+1, nx), dtype=dtype),
                 p=_nplike.zeros((3, ny+1, nx), dtype=dtype),
-                a=_nplike.zeros((ny+1, nx), dtype=dtype),
+                a=ya[1],
                 f=_nplike.zeros((3, ny+1, nx), dtype)
             ),
-            cf=_nplike.zeros((3, ny+1, nx), dtype)
+            cf=_nplike.zeros((3, ny+1, nx), dtype),
+            a=ya
         ),
     )
 
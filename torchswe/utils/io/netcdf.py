@@ -20,6 +20,9 @@ from torchswe.utils.misc import DummyDict as _DummyDict
 
 _logger = _logging.getLogger("torchswe.utils.init")
 
+# keys in variable options that are passed to `createVariable` rather than set as attributes
+_STORAGE_KEYS = ("chunksizes", "zlib", "complevel", "shuffle")
+
 
 def default_attrs(corner, delta):
     """Get basic attributes for a raster NetCDF4 file.
@@ -390,7 +393,8 @@ def add_variables_to_dataset(dset, data, idx_bounds=None, options=None):
     options: a dict of dict
         The outer dictionary has pairs (variable name, dictionary). The inner dictionaries
         are the attributes of each vriable. Usually users may want to at least specify the
-        attribute "units".
+        attribute "units". The keys "chunksizes", "zlib", "complevel", and "shuffle" are not
+        attributes; they are forwarded to `netCDF4.Dataset.createVariable` to control storage.
 
     Returns
     -------
@@ -405,14 +409,18 @@ def add_variables_to_dataset(dset, data, idx_bounds=None, options=None):
     # create variables
     for key, val in data.items():
 
+        # separate storage settings (chunking & compression) from variable attributes
+        attrs = dict(options[key]) if key in options else {}
+        storage = {k: attrs.pop(k) for k in _STORAGE_KEYS if k in attrs}
+
         # create the variable
         shape = ("time", "y", "x") if "time" in dset.dimensions else ("y", "x")
-        dset.createVariable(key, "f8", shape, fill_value=nan)  # all NaN in it right now
+        dset.createVariable(key, "f8", shape, fill_value=nan, **storage)  # all NaN in it right now
 
         # variable attributes
         dset[key].long_name = key
         dset[key].grid_mapping = "mercator"
-        dset[key].setncatts(options[key] if key in options else {})
+        dset[key].setncatts(attrs)
 
         if val is None:  # no need to copy data
             continue